@@ -3,8 +3,15 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
+from __future__ import annotations
+
 import enum
-import typing
+
+# typing is expensive to import and is only needed by type checkers, which
+# treat TYPE_CHECKING as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
 
 class _Empty:
 
@@ -15,10 +22,11 @@ class _Empty:
     equality to themselves, and a __repr__ method.
     """
 
-    __slots__: typing.List[str] = []
+    __slots__ = ()
 
-    def __eq__(self, other) -> typing.Union[bool, 'NotImplemented']:
-        return isinstance(other, type(self))
+    def __eq__(self, other) -> bool:
+        # EMPTY is a singleton (see __reduce__), so identity is sufficient
+        return other is self
 
     def __repr__(self):
         return 'EMPTY'
@@ -26,28 +34,53 @@ class _Empty:
     def __hash__(self):
         return hash('PYTHON MAYBE EMPTY')
 
-
-EMPTY = _Empty()
+    def __reduce__(self):
+        # Make copy and pickle hand back the module level EMPTY instead of a
+        # new instance
+        return 'EMPTY'
 
 
-def _nothing() -> 'Maybe':
-    """internal helper for an empty Maybe()."""
-    return Maybe(EMPTY)
+EMPTY = _Empty()
 
 
 @enum.unique
-class AsMaybe(enum.Enum):
+class AsMaybe(enum.IntEnum):
 
     """Enum to provide maybe() wrappers for dunder methods accessed by type
     casts.
+
+    This is an IntEnum so that the members can index a table of functions,
+    which means they also compare equal to their values. They print as
+    enum members though, not as ints:
+
+    >>> str(AsMaybe.STR)
+    'AsMaybe.STR'
+    >>> AsMaybe.STR == 1
+    True
     """
 
-    STR = enum.auto()
-    BYTES = enum.auto()
-    INT = enum.auto()
-    FLOAT = enum.auto()
-    BOOL = enum.auto()
-    HASH = enum.auto()
+    __str__ = enum.Enum.__str__
+    __format__ = enum.Enum.__format__
+
+    STR = 1
+    BYTES = 2
+    INT = 3
+    FLOAT = 4
+    BOOL = 5
+    HASH = 6
+
+
+# Indexed by the AsMaybe values, so this must be kept in the same order. The
+# values start at 1, so index 0 is a placeholder.
+_AS_MAYBE_FUNCS: tuple[Any, ...] = (
+    None,
+    str,
+    bytes,
+    int,
+    float,
+    bool,
+    hash,
+)
 
 
 class Maybe:
@@ -94,10 +127,13 @@ class Maybe:
     True
     """
 
-    __slots__ = ['__value']
+    __slots__ = ('_value', '__has_value')
 
     def __init__(self, value) -> None:
-        self.__value = value
+        self._value = value
+        # Maybe is immutable, so the emptiness test can be done once here
+        # instead of comparing against EMPTY on every query.
+        self.__has_value = value is not EMPTY
 
     def __call__(self, *args, **kwargs):
         """Try to call the wrapped value with the given args.
@@ -110,21 +146,24 @@ class Maybe:
         0
         """
         try:
-            return Maybe(self.__value(*args, **kwargs))
+            return Maybe(self._value(*args, **kwargs))
         except Exception:
-            return _nothing()
+            return NOTHING
 
     def __getitem__(self, item):
         try:
-            return Maybe(self.__value[item])
+            return Maybe(self._value[item])
         except (IndexError, KeyError, TypeError):
-            return Maybe(getattr(self, item, EMPTY))
+            # Fall back to an attribute, getattr only accepts strings
+            if isinstance(item, str):
+                return Maybe(getattr(self._value, item, EMPTY))
+            return NOTHING
 
     def __getattr__(self, name: str):
-        try:
-            return Maybe(self.__getattribute__(name))
-        except AttributeError:
-            return Maybe(getattr(self.__value, name, EMPTY))
+        # This is only called once normal lookup has failed, so there is no
+        # point in trying self first, the attribute can only come from the
+        # wrapped value.
+        return Maybe(getattr(self._value, name, EMPTY))
 
     def just(self):
         """Get the stored value out of the Maybe instance.
@@ -136,7 +175,7 @@ class Maybe:
         >>> Maybe(EMPTY).just()
         EMPTY
         """
-        return self.__value
+        return self._value
 
     def otherwise(self, fallback=None):
         """Get the value or fallback value.
@@ -149,9 +188,9 @@ class Maybe:
         >>> Maybe(EMPTY).otherwise(0)
         0
         """
-        if self.is_nothing():
+        if not self.__has_value:
             return fallback
-        return self.__value
+        return self._value
 
     def is_something(self) -> bool:
         """Is the value not EMPTY?
@@ -163,7 +202,7 @@ class Maybe:
         >>> Maybe(EMPTY).is_something()
         False
         """
-        return self.__value is not EMPTY
+        return self.__has_value
 
     def is_nothing(self) -> bool:
         """Is the value not EMPTY?
@@ -175,9 +214,9 @@ class Maybe:
         >>> Maybe(EMPTY).is_nothing()
         True
         """
-        return self.__value is EMPTY
+        return not self.__has_value
 
-    def as_maybe(self, dunder: AsMaybe) -> 'Maybe':
+    def as_maybe(self, dunder: AsMaybe) -> Maybe:
         """Get dunders wrapped in Maybes.
 
         Python-maybe does not wrap most dunders in maybes, becuase those are
@@ -197,76 +236,83 @@ class Maybe:
         >>> Maybe(EMPTY).as_maybe(AsMaybe.STR)
         Maybe(EMPTY)
         """
-        if self.is_nothing():
-            return _nothing()
-
-        if dunder is AsMaybe.STR:
-            f = str  # type: typing.Callable[[typing.Any], typing.Any]
-        elif dunder is AsMaybe.BYTES:
-            f = bytes
-        elif dunder is AsMaybe.INT:
-            f = int
-        elif dunder is AsMaybe.FLOAT:
-            f = float
-        elif dunder is AsMaybe.BOOL:
-            f = bool
-        elif dunder is AsMaybe.HASH:
-            f = hash
-        else:
+        if not self.__has_value:
+            return NOTHING
+
+        # AsMaybe is an IntEnum, so plain ints (and bools) would index the
+        # table too. Only accept members.
+        if type(dunder) is not AsMaybe:
             raise RuntimeError('Unsupported dunder {!r}'.format(dunder))
+        f = _AS_MAYBE_FUNCS[dunder]
 
         try:
-            return Maybe(f(self.__value))
+            return Maybe(f(self._value))
         except TypeError:
-            return _nothing()
+            return NOTHING
+
+    # These check the exact type first, which is cheaper than isinstance for
+    # the common Maybe to Maybe case. isinstance is still needed so that
+    # instances of Maybe subclasses are unwrapped too.
 
     def __eq__(self, other):
-        if isinstance(other, Maybe):
-            return self.just() == other.just()
-        return self.just() == other
+        if type(other) is Maybe or isinstance(other, Maybe):
+            other = other._value
+        return self._value == other
 
     def __lt__(self, other):
-        if isinstance(other, Maybe):
-            return self.just() < other.just()
-        return self.just() < other
+        if type(other) is Maybe or isinstance(other, Maybe):
+            other = other._value
+        return self._value < other
 
     def __le__(self, other):
-        if isinstance(other, Maybe):
-            return self.just() <= other.just()
-        return self.just() <= other
+        if type(other) is Maybe or isinstance(other, Maybe):
+            other = other._value
+        return self._value <= other
 
     def __ge__(self, other):
-        if isinstance(other, Maybe):
-            return self.just() >= other.just()
-        return self.just() >= other
+        if type(other) is Maybe or isinstance(other, Maybe):
+            other = other._value
+        return self._value >= other
 
     def __gt__(self, other):
-        if isinstance(other, Maybe):
-            return self.just() > other.just()
-        return self.just() > other
+        if type(other) is Maybe or isinstance(other, Maybe):
+            other = other._value
+        return self._value > other
 
     def __str__(self):
-        return str(self.__value)
+        if not self.__has_value:
+            return 'EMPTY'
+        return str(self._value)
 
     def __bytes__(self):
-        return bytes(self.__value)
+        return bytes(self._value)
 
     def __int__(self):
-        return int(self.__value)
+        return int(self._value)
 
     def __float__(self):
-        return float(self.__value)
+        return float(self._value)
 
     def __repr__(self):
-        return f'Maybe({repr(self.__value)})'
+        return 'Maybe(%r)' % (self._value,)
 
     def __format__(self, format_spec):
-        return self.__value.__format__(format_spec)
+        return self._value.__format__(format_spec)
 
     def __bool__(self):
-        return bool(self.__value)
+        # EMPTY itself is truthy, but an empty Maybe should not be
+        if not self.__has_value:
+            return False
+        return bool(self._value)
 
     def __hash__(self):
-        # This must return the hash of self.__value because it has an __eq__
+        # This must return the hash of self._value because it has an __eq__
         # method
-        return hash(self.__value)
+        return hash(self._value)
+
+
+# Maybe is immutable, so a single empty instance can be shared by every
+# operation that fails, rather than allocating a new one each time. Note that
+# Maybe(EMPTY) does not return this instance, use is_nothing() rather than an
+# identity test.
+NOTHING = Maybe(EMPTY)
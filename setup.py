@@ -1,9 +1,62 @@
 from setuptools import setup, find_packages
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
 from codecs import open
 from os import path
 
 import maybe
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    # maybe.py is valid pure python and valid Cython; when Cython is available
+    # compile it so method dispatch avoids interpreter frame overhead. The
+    # compiled module shadows the .py of the same name, so nothing else needs
+    # to know which one is in use.
+    ext_modules = cythonize(
+        ['maybe/maybe.py'],
+        compiler_directives={
+            'language_level': 3,
+            'binding': True,
+            # Treat annotations as documentation like python does, rather
+            # than as strict C types, so the compiled module behaves exactly
+            # like the pure python one.
+            'annotation_typing': False,
+        },
+    )
+
+
+
+class optional_build_ext(build_ext):
+
+    """build_ext that falls back to the pure python module.
+
+    The compiled module is only an optimization, so a missing or broken C
+    compiler shouldn't make the install fail.
+    """
+
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as e:
+            self.extensions = []
+            self.__warn(e)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as e:
+            # Forget the extension, so it isn't copied or installed later
+            self.extensions = [e for e in self.extensions if e is not ext]
+            self.__warn(e)
+
+    def __warn(self, e):
+        print('WARNING: could not compile the maybe extension, falling '
+              'back to pure python: {}'.format(e))
+
+
 here = path.abspath(path.dirname(__file__))
 
 # Get the long description from the README file
@@ -23,8 +76,6 @@ setup(
         'Development Status :: 3 - Alpha',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3 :: Only',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Intended Audience :: Developers',
@@ -35,5 +86,8 @@ setup(
         ]
     },
     keywords='maybe',
+    python_requires='>=3.7',
     packages=['maybe'],
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': optional_build_ext},
 )
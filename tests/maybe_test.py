@@ -3,9 +3,15 @@
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
 
+import copy
+import doctest
+import pickle
+import typing
+
 import pytest
 
-from maybe.maybe import Maybe, EMPTY, AsMaybe
+import maybe.maybe
+from maybe.maybe import Maybe, EMPTY, NOTHING, AsMaybe
 
 
 class TestMaybe:
@@ -30,11 +36,59 @@ class TestMaybe:
             e = v("foo")
             assert e.is_nothing()
 
+        def test_call_forwards_all_kwargs(self):
+            def foo(**kwargs):
+                return kwargs
+
+            v = Maybe(foo)
+            assert v(_Maybe=1, _NOTHING=2).just() == {'_Maybe': 1, '_NOTHING': 2}
+
+        def test_call_shares_nothing(self):
+            assert Maybe(int)("foo") is NOTHING
+            assert Maybe(None)() is NOTHING
+
         def test_getitem(self):
             e = [1, 2, 3]
             v = Maybe(e)
             assert v[1] == 2
 
+        def test_getitem_dict(self):
+            v = Maybe({'a': 1})
+            assert v['a'] == 1
+            assert v['b'].is_nothing()
+
+        def test_getitem_generic(self):
+            T = typing.TypeVar('T')
+
+            class G(typing.Generic[T]):
+                pass
+
+            assert Maybe(G)[int] == G[int]
+
+        def test_getitem_class_getitem(self):
+            class A:
+                def __class_getitem__(cls, item):
+                    return (cls, item)
+
+            assert Maybe(A)[int] == (A, int)
+
+        def test_getitem_getattr_raises(self):
+            class A:
+                def __getattr__(self, name):
+                    raise RuntimeError(name)
+
+            assert Maybe(A())[0].is_nothing()
+
+        def test_getitem_missing(self):
+            # This used to raise a TypeError from trying getattr() with the
+            # index
+            v = Maybe([1])
+            assert v[5] is NOTHING
+
+        def test_getitem_not_indexable(self):
+            v = Maybe(None)
+            assert v['foo'].is_nothing()
+
         def test_eq(self):
             e = {'a': 1, 'b': 2}
             v = Maybe(e)
@@ -77,10 +131,24 @@ class TestMaybe:
             assert e2 > e
             assert e != e2
 
+        def test_compare_maybe_subclass(self):
+            class Sub(Maybe):
+                __slots__ = ()
+
+            assert Maybe(3) == Sub(3)
+            assert Maybe(3) < Sub(5)
+            assert Sub(5) > Maybe(3)
+            assert Sub(EMPTY) == Sub(EMPTY)
+            assert Maybe(EMPTY) == Sub(EMPTY)
+
         def test_str(self):
             e = Maybe(1)
             assert str(e) == '1'
 
+        def test_str_empty(self):
+            e = Maybe(EMPTY)
+            assert str(e) == 'EMPTY'
+
         def test_bytes(self):
             e = Maybe(1)
             assert bytes(e) == bytes(1)
@@ -113,6 +181,10 @@ class TestMaybe:
             e = Maybe(7)
             assert bool(e)
 
+        def test_bool_empty(self):
+            e = Maybe(EMPTY)
+            assert not bool(e)
+
         class TestAttributes:
 
             class Foo:
@@ -140,6 +212,18 @@ class TestMaybe:
                 m = Maybe(a)
                 assert m.attr.attr.just() is EMPTY
 
+            def test_str_subclass_name(self):
+                class S(str):
+                    pass
+
+                m = Maybe('x')
+                assert getattr(m, S('upper'))().just() == 'X'
+
+            def test_own_attributes(self):
+                m = Maybe(self.Foo(None))
+                assert not isinstance(m.just, Maybe)
+                assert m.just() is not EMPTY
+
         class TestAttributeOrIndex:
 
             class _Tester:
@@ -217,6 +301,14 @@ class TestMaybe:
 
     class TestAsMaybe:
 
+        def test_str(self):
+            assert str(AsMaybe.STR) == 'AsMaybe.STR'
+            assert format(AsMaybe.STR) == 'AsMaybe.STR'
+            assert f'{AsMaybe.INT}' == 'AsMaybe.INT'
+
+        def test_values(self):
+            assert [d.value for d in AsMaybe] == [1, 2, 3, 4, 5, 6]
+
         @pytest.mark.parametrize('d', AsMaybe)
         def test_empty(self, d: AsMaybe):
             m = Maybe(EMPTY)
@@ -231,3 +323,36 @@ class TestMaybe:
         def test_invalid(self, d: AsMaybe):
             m = Maybe(NotImplemented)
             assert m.as_maybe(d).is_nothing()
+
+        def test_unsupported(self):
+            m = Maybe(1)
+            with pytest.raises(RuntimeError):
+                m.as_maybe('str')
+
+        @pytest.mark.parametrize('d', [0, -1, 1, 7, True])
+        def test_unsupported_int(self, d: int):
+            m = Maybe(1)
+            with pytest.raises(RuntimeError):
+                m.as_maybe(d)
+
+
+class TestEmpty:
+
+    def test_eq(self):
+        assert EMPTY == EMPTY
+        assert EMPTY != None
+
+    def test_copy(self):
+        assert copy.copy(EMPTY) is EMPTY
+        assert copy.deepcopy(EMPTY) is EMPTY
+
+    def test_pickle(self):
+        assert pickle.loads(pickle.dumps(EMPTY)) is EMPTY
+
+
+def test_doctests():
+    # Run these from here rather than relying on --doctest-modules, which
+    # can't collect maybe.py when a compiled maybe module shadows it.
+    results = doctest.testmod(maybe.maybe)
+    assert results.attempted
+    assert not results.failed